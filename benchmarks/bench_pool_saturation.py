@@ -0,0 +1,84 @@
+"""Tail latency with more concurrent requests than pooled connections.
+
+Every statement is slowed down by --statement-ms (an event hook sleeps while
+holding the connection), so --concurrency requests compete for a pool of
+--pool-size connections with no overflow. "wait" gives checkouts 30 seconds,
+like SQLAlchemy's default, and every request queues; "bounded" gives them
+--pool-timeout seconds, after which the request gets a 503 with Retry-After.
+Concurrency stays below the 40-thread request threadpool so that the pool is
+the only queue. Each mode runs in its own interpreter. Usage:
+
+    uv run python -m benchmarks.bench_pool_saturation [--requests 600] [--concurrency 32]
+        [--pool-size 4] [--pool-timeout 0.1] [--statement-ms 10]
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+async def run_target(requests: int, concurrency: int, statement_ms: float) -> dict:
+    from sqlalchemy import event
+
+    from benchmarks.common import (
+        asgi_client,
+        quiet_logging,
+        register_and_login,
+        run_load,
+    )
+    from src.db import database
+    from src.main import app
+
+    quiet_logging()
+    # Startup runs no DDL and the benchmark database starts empty
+    database.create_schema()
+    async with asgi_client(app) as client:
+        headers = await register_and_login(client, f"bench_pool_{os.getpid()}")
+        event.listen(database.engine, "before_cursor_execute", lambda *_: time.sleep(statement_ms / 1000))
+        results = await run_load(client, lambda c, i: c.get("/expense/balance", headers=headers), requests, concurrency)
+    results["rejected_503"] = results.pop("errors")
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=600)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--pool-timeout", type=float, default=0.1)
+    parser.add_argument("--statement-ms", type=float, default=10)
+    parser.add_argument("--target", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.target:
+        print(json.dumps(asyncio.run(run_target(args.requests, args.concurrency, args.statement_ms))))
+        return
+
+    results = {"pool_size": args.pool_size, "concurrency": args.concurrency, "statement_ms": args.statement_ms}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode, timeout in (("wait", 30.0), ("bounded", args.pool_timeout)):
+            env = dict(os.environ)
+            env.pop("TEST_ENV", None)
+            env.setdefault("SECRET_KEY", "bench-secret")
+            env.update({
+                "DATABASE_URL": f"sqlite:///{tmp}/bench_pool_{mode}.db",
+                "DB_POOL_SIZE": str(args.pool_size),
+                "DB_MAX_OVERFLOW": "0",
+                "DB_POOL_TIMEOUT": str(timeout),
+            })
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_pool_saturation", "--target", "--requests", str(args.requests),
+                 "--concurrency", str(args.concurrency), "--statement-ms", str(args.statement_ms)],
+                env=env, check=True, capture_output=True, text=True,
+            ).stdout
+            results[mode] = {"pool_timeout_s": timeout, **json.loads(out)}
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks drive the real ASGI app in-process through httpx, so they measure the
+application stack (routing, validation, DB access) without network noise.
+"""
+import asyncio
+import itertools
+import logging
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+RequestFn = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+def quiet_logging(level: int = logging.WARNING) -> None:
+    """Drop per-request INFO logging so it does not dominate the numbers."""
+    logging.disable(level - 1)
+
+
+def timed(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Median wall time of fn() in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: list[float], elapsed: float, errors: int = 0) -> dict[str, float]:
+    """Turn raw per-request latencies (seconds) into req/s and percentiles (ms)."""
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+    }
+
+
+async def run_load(client: httpx.AsyncClient, request: RequestFn, total: int, concurrency: int) -> dict[str, float]:
+    """Issue `total` requests from `concurrency` concurrent workers."""
+    counter = itertools.count()
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        while (i := next(counter)) < total:
+            started = time.perf_counter()
+            response = await request(client, i)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+def asgi_client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+
+async def register_and_login(client: httpx.AsyncClient, username: str, password: str = "benchpass123",
+                             initial_bank: int = 10**9, initial_cash: int = 10**9) -> dict[str, str]:
+    """Create a user and return bearer auth headers for it."""
+    await client.post("/auth/register", json={
+        "username": username, "password": password,
+        "initial_bank": initial_bank, "initial_cash": initial_cash,
+    })
+    response = await client.post("/auth/login", data={"username": username, "password": password})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}